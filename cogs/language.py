@@ -3,10 +3,11 @@
 from discord.ext import commands
 import discord
 
-from typing import Literal, Union, List, Tuple
+from typing import Literal, Union
 from aiofiles import open as async_open
-from ujson import loads
-from copy import copy
+from orjson import loads
+from sys import intern
+import re
 
 from data import is_admin
 
@@ -29,10 +30,14 @@ class Language(commands.Cog):
     もし翻訳済みに交換してほしくないテキストの場合は引数で`replace_language=False`とやればよいです。"""
 
     LANGUAGES = ("ja", "en")
+    # `$xxx$`のxxxの部分を取り出すためのものと言語データの`$$`を探すためのもの。
+    _qpat = re.compile(r"\$([^$]*)\$")
+    _rpat = re.compile(r"\$\$")
 
     def __init__(self, bot):
         self.bot = bot
         self.cache = {}
+        self._cache_get = self.cache.get
         self.bot.cogs["OnSend"].add_event(self._new_send, "on_send")
 
     async def _new_send(self, channel, *args, **kwargs):
@@ -58,54 +63,51 @@ class Language(commands.Cog):
 
         return args, kwargs
 
-    def _extract_question(self, text: str, parse_character: str = "$") -> Tuple[List[str], List[str]]:
-        # 渡された文字列の中にある`$xxx$`のxxxのやところを
-        now, now_target, results, other = "", False, [], ""
-
-        for char in text:
-            if char == parse_character:
-                if now_target:
-                    results.append(now)
-                    now_target = False
-                    now = ""
-                else:
-                    now_target = True
-            if now_target and char != parse_character:
-                now += char
-            else:
-                other += char
-
-        return results, other
-
     def _get_reply(self, text: str, lang: Literal[LANGUAGES]) -> str:
         # 指定された文字を指定された言語で交換します。
-        # $で囲まれている部分を取得しておく。
-        results, text = self._extract_question(text)
+        # 日本語なら言語データは見ずに`$xxx$`の$を外すだけで良い。
+        if lang == "ja":
+            return self._qpat.sub(r"\1", text) if "$" in text else text
+        # $がないならそのまま言語データから文字列を取得する。
+        if "$" not in text:
+            # 言語データのどの文字列とも最初の文字が違うなら交換するものはない。
+            if text[:1] not in self._first_chars:
+                return text
+            return self._by_lang[lang].get(text, text)
+
+        # $で囲まれている部分を取得しつつ`$$`に置き換えて言語データのキーを作る。
+        results = []
+
+        def extract(match: re.Match) -> str:
+            results.append(match.group(1))
+            return "$$"
+
+        text = self._qpat.sub(extract, text)
 
         # 言語データから文字列を取得する。
-        result = self.replies.get(text, {}).get(lang, text)
+        result = self._by_lang[lang].get(text, text)
 
         # 上で$で囲まれた部分を取得したのでその囲まれた部分を交換する。
-        for word in results:
-            result = result.replace("$$", word, 1)
-
-        return result
+        # 言語データの方の`$$`が多い場合は余った`$$`はそのままにする。
+        words = iter(results)
+        return self._rpat.sub(lambda _: next(words, "$$"), result)
 
     def _replace_embed(self, embed: discord.Embed, lang: Literal[LANGUAGES]) -> discord.Embed:
         # Embedを指定された言語コードで交換します。
-        # タイトルとディスクリプションを交換する。
-        for n in ("title", "description"):
-            if getattr(embed, n) is not discord.Embed.Empty:
-                setattr(embed, n, self._get_reply(getattr(embed, n), lang))
-        # Embedにあるフィールドの文字列を交換する。
-        new_fields = []
-        for field in embed.fields:
-            field.name = self._get_reply(field.name, lang)
-            field.value = self._get_reply(field.value, lang)
-        # Embedのフッターを交換する。
-        if embed.footer:
-            if embed.footer.text is not discord.Embed.Empty:
-                embed.footer.text = self._get_reply(embed.footer.text, lang)
+        # タイトル、ディスクリプション、フッター、フィールドの文字列をまとめて交換する。
+        fields = embed.fields
+        texts = [embed.title, embed.description, embed.footer.text]
+        for field in fields:
+            texts.extend((field.name, field.value))
+        texts = [text if text is discord.Embed.Empty else self._get_reply(text, lang)
+                 for text in texts]
+        # 交換した文字列をEmbedに戻す。
+        embed.title, embed.description = texts[0], texts[1]
+        if texts[2] is not discord.Embed.Empty:
+            embed.set_footer(text=texts[2], icon_url=embed.footer.icon_url)
+        for i, field in enumerate(fields):
+            embed.set_field_at(
+                i, name=texts[3 + i * 2], value=texts[4 + i * 2], inline=field.inline)
         return embed
 
     def get_text(self, text: Union[str, discord.Embed],
@@ -113,7 +115,8 @@ class Language(commands.Cog):
         """渡された言語コードに対応する文字列に渡された文字列を交換します。  
         また言語コードの代わりにユーザーIDを渡すことができます。  
         ユーザーIDを渡した場合はそのユーザーIDに設定されている言語コードが使用されます。  
-        またまた文字列の代わりにdiscord.Embedなどを渡すこともできます。
+        またまた文字列の代わりにdiscord.Embedなどを渡すこともできます。  
+        この時渡したdiscord.Embedはコピーされずにそのまま書き換えられるので注意してください。
 
         Parameters
         ----------
@@ -131,8 +134,16 @@ class Language(commands.Cog):
 
     async def update_language(self) -> None:
         # 言語データを更新します。
-        async with async_open("data/replies.json") as f:
+        async with async_open("data/replies.json", "rb") as f:
             self.replies = loads(await f.read())
+        # 交換時に一回の検索で済むように言語ごとの`{元の文字列: 翻訳済み文字列}`の辞書を作っておく。
+        # 辞書を小さくするためにその言語の翻訳がない文字列は入れない。
+        self._by_lang = {
+            lang: {intern(src): tr[lang] for src, tr in self.replies.items() if lang in tr}
+            for lang in self.LANGUAGES
+        }
+        # 交換対象にならない文字列をすぐ弾けるように言語データの最初の文字を集めておく。
+        self._first_chars = frozenset(key[:1] for key in self.replies)
 
     @commands.command(
         extras={"headding": {"ja": "言語データを再読込します。",
@@ -148,9 +159,13 @@ class Language(commands.Cog):
     async def update_cache(self, cursor):
         # キャッシュを更新します。
         # キャッシュがあるのはコマンドなど実行時に毎回データベースから読み込むのはあまりよくないから。
-        async for row in cursor.get_datas("language", {}):
-            if row:
-                self.cache[row[0]] = row[1]
+        # 途中の状態のキャッシュが読まれないように新しい辞書を作ってから入れ替える。
+        new_cache = {
+            row[0]: row[1] for row in await cursor.get_all_datas("language", {})
+            if row
+        }
+        self.cache = new_cache
+        self._cache_get = new_cache.get
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -179,7 +194,7 @@ class Language(commands.Cog):
         Returns
         -------
         Literal["ja", "en"] : 言語コード。"""
-        return self.cache.get(ugid, "ja")
+        return self._cache_get(ugid, "ja")
 
     @commands.command(
         aliases=["lang"],
@@ -235,7 +250,6 @@ class Language(commands.Cog):
                 await cursor.update_data("language", {"language": language}, targets)
             else:
                 targets["language"] = language
-                print(targets)
                 await cursor.insert_data("language", targets)
             await self.update_cache(cursor)
 
@@ -31,7 +31,10 @@ from discord.ext import commands
 import discord
 
 from typing import Tuple, Callable
-from copy import deepcopy
+
+
+# アイテム名と対応するdiscord.uiのデコレーターです。
+_UI_FACTORY = {"button": discord.ui.button, "select": discord.ui.select}
 
 
 def item(name: str, callback: Callable, **kwargs) -> Tuple[Callable, Callable]:
@@ -40,13 +43,13 @@ def item(name: str, callback: Callable, **kwargs) -> Tuple[Callable, Callable]:
     Parameters
     ----------
     name : str
-        アイテムの種類の名前。  
+        アイテムの種類の名前。`button`または`select`です。  
         例：`discord.ui.button`の`button`
     callback : Callable
         インタラクションがきた際に呼び出されるコルーチン関数。
     **kwargs : dict
         nameで指定したdiscord.uiのアイテムに渡す引数です。"""
-    return (getattr(discord.ui, name)(**kwargs), callback)
+    return (_UI_FACTORY[name](**kwargs), callback)
 
 
 def make_view(view_name: str, items: Tuple[Tuple[Callable, Callable], ...]) -> dict:
@@ -112,8 +115,6 @@ class View:
         self.items: list = []
         self.view_name: str = view_name
         self._args, self._kwargs = args, kwargs
-        # rtlibのViewかどうかの判別用の変数。
-        self._rtlib_view = 0
 
     def add_item(self, item_name: str, callback: Callable, **kwargs) -> None:
         """Viewにアイテムを追加します。
@@ -176,39 +177,39 @@ class Componesy(commands.Cog):
         items = kwargs.get("view", None)
 
         # rtlib.componesyによるviewならそれをdiscord.ui.Viewに交換する。
-        is_view = hasattr(items, "_rtlib_view")
+        is_view = isinstance(items, View)
         if isinstance(items, dict) or is_view:
             if is_view:
                 items = items._make_items()
             # viewの名前を取る。
             view_name = items["view_name"]
             class_args, class_kwargs = items["args"], items["kwargs"]
+            # Viewのキャッシュは名前とコールバックの組み合わせで保存する。
+            signature = (view_name, tuple(coro.__qualname__ for _, coro in items["items"]))
 
             # Viewがまだ作られてないなら作る。
-            if view_name not in self.views:
+            if signature not in self.views:
                 # componesyによるアイテムを新しく作るViewに追加する関数リストに追加していく。
                 functions = {}
 
                 for uiitem, coro in items["items"]:
-                    if coro.__self__ is None:
-                        new_coro = coro
-                    else:
-                        # もしメソッドならViewに設定できないのでラップする。
-                        # 二重ラップしないとcoroが2個目以降のcoroと同じになる。
-                        async def new_coro(*args, _coro_original=coro, **kwargs):
-                            async def new_coro():
-                                return await _coro_original(*args, **kwargs)
-                            return await new_coro()
-
+                    # Viewのクラスは同じ名前とコールバックの別のインスタンスでも使い回すので、
+                    # コールバックはクラスには入れずにViewのインスタンスに保存したものを呼び出す。
+                    # nameはデフォルト引数で渡して2個目以降のnameと同じにならないようにする。
+                    async def new_coro(view, item, interaction, _name=coro.__name__):
+                        return await view._componesy_callbacks[_name](view, item, interaction)
+                    new_coro.__name__ = coro.__name__
                     functions[coro.__name__] = uiitem(new_coro)
-                    del new_coro, coro
 
                 # typeを使用して動的にdiscord.ui.Viewを継承した上で追加した関数をつけたクラスを作成する。
                 # キャッシュに毎回Viewを作らないようにViewクラスを保存しておく。
-                self.views[view_name] = type(view_name, (discord.ui.View,), functions)
+                self.views[signature] = type(view_name, (discord.ui.View,), functions)
 
-            # Viewのインスタンスを作りsendの引数viewに設定をする。
-            kwargs["view"] = self.views[view_name](*class_args, **class_kwargs)
+            # Viewのインスタンスを作りコールバックを保存してsendの引数viewに設定をする。
+            view = self.views[signature](*class_args, **class_kwargs)
+            view._componesy_callbacks = {
+                coro.__name__: coro for _, coro in items["items"]}
+            kwargs["view"] = view
 
         # 引数を返す。
         return args, kwargs
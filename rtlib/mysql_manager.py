@@ -209,6 +209,36 @@ class Cursor:
         if commit:
             await self.connection.commit()
 
+    async def _select(self, table: str, targets: Dict[str, Any]) -> None:
+        # 特定のテーブルにある特定の条件のデータを取得するSELECTを実行する。
+        if targets:
+            conditions, args = self._get_column_args(targets)
+            conditions = " WHERE " + conditions[:-4]
+        else:
+            conditions, args = "", ()
+        await self.cursor.execute(
+            f"SELECT * FROM {table}{conditions}", args)
+
+    async def get_all_datas(self, table: str, targets: Dict[str, Any]) -> list:
+        """特定のテーブルにある特定の条件のデータを全て一度に取得します。  
+        `Cursor.get_datas`と違いジェネレーターではなくリストで返します。  
+        引数は`Cursor.get_datas`と同じです。
+
+        Returns
+        -------
+        list
+            取得したデータのリストです。  
+            `[[なにか, なにか], [なにか, なにか]]`のようになっています。  
+            見つからない場合は空である`[]`となります。
+
+        Examples
+        --------
+        async with db.get_cursor() as cursor:
+            rows = await cursor.get_all_datas("tasuren_friends", {})
+            names = [row[0] for row in rows]"""
+        await self._select(table, targets)
+        return list(await self.cursor.fetchall())
+
     async def get_datas(self, table: str, targets: Dict[str, Any], _fetchall: bool = True) -> list:
         """特定のテーブルにある特定の条件のデータを取得します。  
         見つからない場合は空である`[]`が返されます。  
@@ -232,13 +262,7 @@ class Cursor:
         Notes
         -----
         もし条件関係なく全てを取得したい場合は引数の`targets`を空である`{}`にしましょう。"""
-        if targets:
-            conditions, args = self._get_column_args(targets)
-            conditions = " WHERE " + conditions[:-4]
-        else:
-            conditions, args = "", ()
-        await self.cursor.execute(
-            f"SELECT * FROM {table}{conditions}", args)
+        await self._select(table, targets)
         if not _fetchall:
             rows = await self.cursor.fetchall()
         else:
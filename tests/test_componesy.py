@@ -0,0 +1,96 @@
+# rtlib.ext.componesyのテスト
+
+from asyncio import new_event_loop
+
+import discord
+
+from rtlib.ext import componesy
+from rtlib.ext.embeds import Embeds
+
+
+class FakeOnSend:
+    def add_event(self, coro, event_name=None, first=False):
+        pass
+
+
+class FakeBot:
+    def __init__(self):
+        self.cogs = {"OnSend": FakeOnSend()}
+
+
+class Callbacks:
+    def __init__(self):
+        self.called = []
+
+    async def first(self, view, button, interaction):
+        self.called.append("first")
+
+    async def second(self, view, button, interaction):
+        self.called.append("second")
+
+
+def _make_view(view):
+    # componesyのViewからdiscord.ui.Viewを作る。
+    loop = new_event_loop()
+    try:
+        async def make():
+            cog = componesy.Componesy(FakeBot())
+            _, kwargs = await cog._new_send(None, view=view)
+            return kwargs["view"]
+        return loop.run_until_complete(make())
+    finally:
+        loop.close()
+
+
+def test_view_from_bound_methods():
+    callbacks = Callbacks()
+    view = componesy.View("TestBoundView")
+    view.add_item("button", callbacks.first, label="first")
+    view.add_item("button", callbacks.second, label="second")
+
+    ui_view = _make_view(view)
+    assert isinstance(ui_view, discord.ui.View)
+    assert [child.label for child in ui_view.children] == ["first", "second"]
+
+    # それぞれのボタンが自分のコールバックを呼び出すか確認する。
+    loop = new_event_loop()
+    try:
+        for child in ui_view.children:
+            loop.run_until_complete(child.callback(None))
+    finally:
+        loop.close()
+    assert callbacks.called == ["first", "second"]
+
+
+def test_view_uses_callbacks_of_its_own_instance():
+    # 同じ名前とコールバックのViewでもそれぞれのインスタンスのコールバックが呼ばれるか確認する。
+    cog = componesy.Componesy(FakeBot())
+    loop = new_event_loop()
+    try:
+        async def make(callbacks):
+            view = componesy.View("TestSharedView")
+            view.add_item("button", callbacks.first, label="first")
+            _, kwargs = await cog._new_send(None, view=view)
+            return kwargs["view"]
+
+        old, new = Callbacks(), Callbacks()
+        old_view = loop.run_until_complete(make(old))
+        new_view = loop.run_until_complete(make(new))
+        assert type(old_view) is type(new_view)
+
+        loop.run_until_complete(new_view.children[0].callback(None))
+    finally:
+        loop.close()
+    assert old.called == []
+    assert new.called == ["first"]
+
+
+def test_view_from_embeds_callbacks():
+    embeds = Embeds("TestEmbedsView")
+    view = embeds._on_view(componesy.View(embeds.name))
+
+    ui_view = _make_view(view)
+    assert [child.label for child in ui_view.children] == [
+        Embeds.Texts.dash_left, Embeds.Texts.left,
+        Embeds.Texts.right, Embeds.Texts.dash_right
+    ]
@@ -0,0 +1,94 @@
+# cogs.languageのテスト
+
+from asyncio import new_event_loop
+
+import discord
+import pytest
+
+from cogs.language import Language
+
+
+REPLIES = """{
+    "タイトル": {"en": "Title"},
+    "説明": {"en": "Description"},
+    "フッター": {"en": "Footer"},
+    "名前": {"en": "Name"},
+    "値": {"en": "Value"},
+    "テスト": {"en": "test"},
+    "現在のRTのレイテンシ：$$ms": {"en": "Now RT latency:$$ms"},
+    "$$と$$": {"en": "$$ and $$"},
+    "空：$$": {"en": "Empty:$$"},
+    "$$が多い": {"en": "$$ and $$ are many"}
+}"""
+
+
+@pytest.fixture
+def language(tmp_path, monkeypatch):
+    # 言語データを読み込んだLanguageを作る。
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "replies.json").write_text(REPLIES, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    # discord.py 2.0からはEmbed.Emptyの代わりにNoneが使われている。
+    monkeypatch.setattr(discord.Embed, "Empty", None, raising=False)
+
+    cog = Language.__new__(Language)
+    loop = new_event_loop()
+    try:
+        loop.run_until_complete(cog.update_language())
+    finally:
+        loop.close()
+    return cog
+
+
+def _make_embed(icon_url=None):
+    embed = discord.Embed(title="タイトル", description="説明", color=0x0066ff)
+    if icon_url is None:
+        embed.set_footer(text="フッター")
+    else:
+        embed.set_footer(text="フッター", icon_url=icon_url)
+    embed.add_field(name="名前", value="値", inline=False)
+    embed.add_field(name="名前", value="翻訳なし")
+    return embed
+
+
+@pytest.mark.parametrize("icon_url", (None, "https://example.com/icon.png"))
+def test_replace_embed(language, icon_url):
+    embed = language.get_text(_make_embed(icon_url), "en")
+
+    assert embed.title == "Title"
+    assert embed.description == "Description"
+    assert embed.color.value == 0x0066ff
+    assert embed.footer.text == "Footer"
+    assert embed.footer.icon_url == icon_url
+    assert [(field.name, field.value, field.inline) for field in embed.fields] == [
+        ("Name", "Value", False), ("Name", "翻訳なし", True)
+    ]
+
+
+def test_replace_embed_without_footer(language):
+    embed = discord.Embed(title="タイトル")
+    embed = language.get_text(embed, "en")
+
+    assert embed.title == "Title"
+    assert embed.footer.text is None
+    assert embed.to_dict().get("footer") is None
+
+
+@pytest.mark.parametrize(("text", "ja", "en"), (
+    # $がない文字列
+    ("テスト", "テスト", "test"),
+    ("未登録", "未登録", "未登録"),
+    # $で囲まれた部分が一つ
+    ("現在のRTのレイテンシ：$12$ms", "現在のRTのレイテンシ：12ms", "Now RT latency:12ms"),
+    # $で囲まれた部分が複数
+    ("$a$と$b$", "aとb", "a and b"),
+    # 空の$$
+    ("空：$$", "空：", "Empty:"),
+    # 翻訳の方が`$$`が多い
+    ("$a$が多い", "aが多い", "a and $$ are many"),
+    # 閉じられていない$
+    ("価格は$100", "価格は$100", "価格は$100")
+))
+def test_get_reply(language, text, ja, en):
+    assert language._get_reply(text, "ja") == ja
+    assert language._get_reply(text, "en") == en